@@ -0,0 +1,317 @@
+# crypto_trading_agent/_async_fetch.py
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import ccxt
+
+from ._ohlcv_cache import CACHE_ROOT, write_json_atomic
+
+# ccxt async exchanges bind their aiohttp session to the event loop they are
+# first used on, so a process-wide instance needs a loop that outlives any
+# single call. One daemon thread runs that loop; sync callers submit
+# coroutines to it, which also works when the caller is itself inside a
+# running event loop (as ADK tools may be).
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# ex_id -> (exchange, supported timeframes); an empty set means "unknown".
+# Only touched from the loop thread.
+_async_exchanges: Dict[str, Tuple[Any, frozenset]] = {}
+_creating: Dict[str, "asyncio.Future[Tuple[Any, frozenset]]"] = {}
+
+MARKETS_CACHE_ROOT = CACHE_ROOT.parent / "markets"
+MARKETS_TTL_SECONDS = 24 * 3600
+
+# How long the first candidate in a race runs alone before the fallbacks are
+# started as well.
+HEDGE_DELAY_SECONDS = 2.0
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="ccxt-async-loop", daemon=True
+            ).start()
+            atexit.register(_shutdown)
+    return _loop
+
+
+def run(coro: Any, timeout: Optional[float] = None) -> Any:
+    """Run ``coro`` on the background loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result(timeout)
+
+
+async def _load_markets_cached(ex: Any) -> None:
+    """Load markets for ``ex``, reusing ``.cache/markets/<id>.json`` if fresh.
+
+    CCXT otherwise calls ``load_markets()`` implicitly on the first fetch,
+    which can block for several seconds. A cached file younger than
+    ``MARKETS_TTL_SECONDS`` is applied with ``set_markets``; otherwise the
+    markets are loaded from the exchange and written back to the cache.
+    """
+    path = MARKETS_CACHE_ROOT / f"{ex.id}.json"
+    try:
+        if time.time() - path.stat().st_mtime < MARKETS_TTL_SECONDS:
+            with open(path, "r", encoding="utf-8") as fh:
+                ex.set_markets(json.load(fh))
+            return
+    except (OSError, ValueError):
+        pass
+
+    markets = await ex.load_markets()
+    try:
+        write_json_atomic(path, markets)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+async def _create_exchange(exchange_id: str) -> Tuple[Any, frozenset]:
+    # Imported here, on the loop thread, rather than at module import: the
+    # async package is slow to load and only needed once a client is built.
+    import ccxt.async_support as ccxt_async
+
+    if exchange_id not in ccxt_async.exchanges:
+        raise ValueError(f"Exchange id not supported by ccxt: {exchange_id}")
+    exchange_cls = getattr(ccxt_async, exchange_id)
+    ex = exchange_cls({"enableRateLimit": True, "asyncio_loop": _loop})
+    try:
+        await _load_markets_cached(ex)
+    except BaseException:
+        await ex.close()
+        raise
+    entry = (ex, frozenset(getattr(ex, "timeframes", None) or ()))
+    _async_exchanges[exchange_id] = entry
+    return entry
+
+
+async def get_exchange(exchange_id: str) -> Tuple[Any, frozenset]:
+    """Return the shared ``(exchange, timeframes)`` entry, creating it lazily.
+
+    New exchanges have their markets loaded before being registered, so a
+    failure leaves no half-initialized entry behind. Concurrent callers
+    share one creation; cancelling one of them does not cancel it for the
+    others.
+
+    Raises
+    ------
+    ValueError
+        If the exchange id is not supported by ``ccxt.async_support``.
+    """
+    entry = _async_exchanges.get(exchange_id)
+    if entry is not None:
+        return entry
+
+    fut = _creating.get(exchange_id)
+    if fut is None:
+        fut = asyncio.ensure_future(_create_exchange(exchange_id))
+        _creating[exchange_id] = fut
+        fut.add_done_callback(lambda _: _creating.pop(exchange_id, None))
+    return await asyncio.shield(fut)
+
+
+def warm_up(
+    exchange_id: str,
+    on_error: Optional[Callable[[str, BaseException], None]] = None,
+) -> None:
+    """Start creating ``exchange_id`` (and loading its markets) in the background.
+
+    Returns immediately. If creation fails, ``on_error(exchange_id, exc)`` is
+    called (on the loop thread) so the caller can record the failure, e.g.
+    put the exchange on cooldown.
+    """
+
+    def _done(fut: "concurrent.futures.Future[Any]") -> None:
+        exc = None if fut.cancelled() else fut.exception()
+        if exc is not None and on_error is not None:
+            on_error(exchange_id, exc)
+
+    fut = asyncio.run_coroutine_threadsafe(get_exchange(exchange_id), _get_loop())
+    fut.add_done_callback(_done)
+
+
+async def _fetch_one(ex_id: str, pair: str, timeframe: str, limit: int) -> list:
+    """Fetch raw OHLCV rows for one timeframe from one exchange.
+
+    Requests go through ccxt's own throttler (``enableRateLimit``), so
+    concurrent calls still respect the exchange's rate limit.
+    """
+    ex, timeframes = await get_exchange(ex_id)
+    if timeframes and timeframe not in timeframes:
+        raise ccxt.NotSupported(f"timeframe '{timeframe}' not supported")
+    return await ex.fetch_ohlcv(pair, timeframe=timeframe, limit=limit)
+
+
+async def _fetch_many(
+    exchange_id: str,
+    pair: str,
+    timeframes: Sequence[str],
+    limit: int,
+) -> List[Tuple[str, Any]]:
+    results = await asyncio.gather(
+        *[_fetch_one(exchange_id, pair, tf, limit) for tf in timeframes],
+        return_exceptions=True,
+    )
+    return list(zip(timeframes, results))
+
+
+def fetch_many(
+    exchange_id: str,
+    pair: str,
+    timeframes: Sequence[str],
+    limit: int,
+) -> List[Tuple[str, Any]]:
+    """Fetch OHLCV for several timeframes of one pair concurrently.
+
+    Parameters
+    ----------
+    exchange_id : str
+        CCXT exchange id to query.
+    pair : str
+        Market symbol, e.g. ``'BTC/USDT'``.
+    timeframes : sequence of str
+        Timeframes to fetch, e.g. ``['15m', '1h', '4h']``.
+    limit : int
+        Number of candles per timeframe.
+
+    Returns
+    -------
+    list[tuple]
+        ``(timeframe, result)`` pairs in input order, where ``result`` is
+        either the raw OHLCV rows or the exception raised for that timeframe.
+    """
+    return run(_fetch_many(exchange_id, pair, timeframes, limit))
+
+
+async def _race_fetch(
+    candidates: Sequence[str],
+    pair: str,
+    timeframe: str,
+    limit: int,
+    hedge_delay: float,
+) -> Tuple[Optional[str], Any, Dict[str, BaseException]]:
+    tasks: Dict["asyncio.Task[list]", str] = {}
+
+    def launch(ex_id: str) -> "asyncio.Task[list]":
+        task = asyncio.ensure_future(_fetch_one(ex_id, pair, timeframe, limit))
+        tasks[task] = ex_id
+        return task
+
+    errors: Dict[str, BaseException] = {}
+    primary, fallbacks = candidates[0], list(candidates[1:])
+    pending = set()
+    # The head start counts from when the primary is ready to send its
+    # request, so a cold start (client creation, markets load) neither hands
+    # the race to the fallbacks nor makes them all load their markets too.
+    # Getting ready is itself bounded by hedge_delay: a primary that is cold
+    # and unreachable must not hold the fallbacks back for its load timeout.
+    ready = asyncio.ensure_future(get_exchange(primary))
+    await asyncio.wait({ready}, timeout=hedge_delay)
+    if not ready.done():
+        # Creation carries on (shared with the primary's fetch below); stop
+        # waiting for it and race everyone now.
+        ready.cancel()
+        pending.add(launch(primary))
+        pending.update(launch(ex_id) for ex_id in fallbacks)
+        fallbacks = []
+    elif ready.exception() is not None:
+        errors[primary] = ready.exception()
+    else:
+        pending.add(launch(primary))
+    if not pending:
+        pending.update(launch(ex_id) for ex_id in fallbacks)
+        fallbacks = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=hedge_delay if fallbacks else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                exc = task.exception()
+                if exc is None:
+                    return tasks[task], task.result(), errors
+                errors[tasks[task]] = exc
+            # The head start is over (timeout or failure): race everyone else.
+            if fallbacks:
+                pending.update(launch(ex_id) for ex_id in fallbacks)
+                fallbacks = []
+        return None, None, errors
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def race(
+    candidates: Sequence[str],
+    pair: str,
+    timeframe: str,
+    limit: int,
+    hedge_delay: float = HEDGE_DELAY_SECONDS,
+) -> Tuple[Optional[str], Any, Dict[str, BaseException]]:
+    """Fetch OHLCV from the first candidate exchange that answers successfully.
+
+    The first candidate gets a ``hedge_delay`` head start, measured from
+    when its client is ready (created, markets loaded); if getting ready
+    itself takes longer than ``hedge_delay``, everyone is raced at that
+    point. If it has not
+    answered by then, or fails sooner, the remaining candidates are started
+    together and the first success wins; the rest are cancelled. Latency
+    during an outage is therefore bounded by the fastest healthy fallback
+    rather than the sum of timeouts.
+
+    Parameters
+    ----------
+    candidates : sequence of str
+        Exchange ids in preference order; must not be empty.
+    pair : str
+        Market symbol, e.g. ``'BTC/USDT'``.
+    timeframe : str
+        Timeframe to fetch.
+    limit : int
+        Number of candles.
+    hedge_delay : float, optional
+        Head start for the first candidate, in seconds.
+
+    Returns
+    -------
+    tuple
+        ``(exchange_id, raw, errors)`` where ``exchange_id``/``raw`` are
+        ``None`` if every candidate failed and ``errors`` maps each failed
+        exchange id to its exception.
+    """
+    return run(_race_fetch(list(candidates), pair, timeframe, limit, hedge_delay))
+
+
+def _shutdown() -> None:
+    """Close all async exchange sessions and stop the background loop."""
+    if _loop is None:
+        return
+
+    async def _close_all() -> None:
+        for ex, _ in list(_async_exchanges.values()):
+            try:
+                await ex.close()
+            except Exception:
+                pass
+        _async_exchanges.clear()
+
+    try:
+        run(_close_all(), timeout=5)
+    except Exception:
+        pass
+    _loop.call_soon_threadsafe(_loop.stop)
@@ -0,0 +1,30 @@
+# crypto_trading_agent/_njit.py
+
+"""Optional Numba support.
+
+Exposes ``njit`` and ``NUMBA_AVAILABLE``. When numba is not installed,
+``njit`` is a no-op decorator so kernels still run as plain Python/NumPy.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional speed-up, not a requirement
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` supporting both call styles.
+
+        Works as ``@njit`` and as ``@njit(...)`` (including with an explicit
+        signature string), always returning the undecorated function.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -0,0 +1,207 @@
+# crypto_trading_agent/_ohlcv_cache.py
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+_TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
+CACHE_ROOT = Path(__file__).resolve().parent.parent / ".cache" / "ohlcv"
+
+CacheKey = Tuple[str, str, str, int, int]
+
+
+def timeframe_seconds(timeframe: str) -> Optional[int]:
+    """Return the length of a timeframe in seconds, or ``None`` if unknown.
+
+    Parameters
+    ----------
+    timeframe : str
+        Timeframe string such as ``'15m'`` or ``'1h'``.
+    """
+    return _TIMEFRAME_SECONDS.get(timeframe)
+
+
+def make_key(
+    exchange_id: str,
+    pair: str,
+    timeframe: str,
+    limit: int,
+    now: Optional[float] = None,
+) -> Optional[CacheKey]:
+    """Build the cache key for a request, aligned to the current candle.
+
+    The last element is ``floor(now / timeframe_seconds)``, so the key stays
+    stable while a candle is forming and changes when it rolls over.
+
+    Returns
+    -------
+    tuple or None
+        ``(exchange_id, pair, timeframe, limit, bucket)``, or ``None`` when
+        the timeframe is not cacheable.
+    """
+    tf_sec = timeframe_seconds(timeframe)
+    if tf_sec is None:
+        return None
+    if now is None:
+        now = time.time()
+    bucket = int(now) // tf_sec
+    return (exchange_id, pair, timeframe, int(limit), bucket)
+
+
+def write_json_atomic(path: Path, obj: Any) -> None:
+    """Write ``obj`` as JSON to ``path`` via a temp file and ``os.replace``.
+
+    Readers never observe a partially written file.
+
+    Raises
+    ------
+    OSError
+        If the directory cannot be created or the file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(obj, fh)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _encode(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an entry's column arrays to lists for JSON."""
+    return {
+        "exchange": entry["exchange"],
+        "fetched_at": entry["fetched_at"],
+        "soa": {name: col.tolist() for name, col in entry["soa"].items()},
+    }
+
+
+def _decode(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the column arrays of an entry loaded from JSON."""
+    soa = {
+        name: np.asarray(
+            col, dtype=np.int64 if name == "timestamp" else np.float64
+        )
+        for name, col in payload["soa"].items()
+    }
+    # Files written before fetched_at was recorded count as oldest.
+    fetched_at = float(payload.get("fetched_at", 0.0))
+    return {"exchange": payload["exchange"], "soa": soa, "fetched_at": fetched_at}
+
+
+class FileCache:
+    """Two-level (memory + JSON file) cache for OHLCV candles.
+
+    Entries are dicts ``{"exchange": str, "soa": {column: ndarray},
+    "fetched_at": float}`` where ``soa`` holds the candle columns as NumPy
+    arrays and ``fetched_at`` is the epoch time the candles were fetched.
+
+    Files are laid out as
+    ``<root>/<exchange>/<pair_safe>/<timeframe>_<limit>_<bucket>.json`` and
+    written atomically via ``os.replace`` on a temp file. A small in-process
+    LRU dict keyed by the same tuple serves repeat hits without touching
+    disk.
+
+    Parameters
+    ----------
+    root : Path, optional
+        Cache directory. Defaults to ``<project>/.cache/ohlcv``.
+    max_memory_entries : int, optional
+        Maximum number of entries kept in memory. Defaults to ``128``.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_memory_entries: int = 128):
+        self.root = Path(root) if root is not None else CACHE_ROOT
+        self.max_memory_entries = int(max_memory_entries)
+        self._memory: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+
+    def _path(self, key: CacheKey) -> Path:
+        exchange_id, pair, timeframe, limit, bucket = key
+        pair_safe = pair.replace("/", "_").replace(":", "_")
+        return self.root / exchange_id / pair_safe / f"{timeframe}_{limit}_{bucket}.json"
+
+    def _remember(self, key: CacheKey, entry: Dict[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(
+        self,
+        key: CacheKey,
+        max_age: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key`` or ``None`` on a miss.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key from :func:`make_key`.
+        max_age : float, optional
+            If given, entries fetched more than ``max_age`` seconds before
+            ``now`` count as a miss. The key's bucket keeps an entry for the
+            whole candle, but its last (still forming) candle goes stale
+            much sooner.
+        now : float, optional
+            Current epoch time; defaults to ``time.time()``.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        else:
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as fh:
+                    entry = _decode(json.load(fh))
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+            self._remember(key, entry)
+
+        if max_age is not None:
+            if now is None:
+                now = time.time()
+            if now - entry["fetched_at"] > max_age:
+                return None
+        return entry
+
+    def set(self, key: CacheKey, entry: Dict[str, Any]) -> None:
+        """Store ``entry`` under ``key`` in memory and on disk.
+
+        Disk errors are swallowed: the cache is an optimization and must
+        never make a successful fetch fail. Files from older buckets of the
+        same series are removed after the write.
+        """
+        self._remember(key, entry)
+
+        path = self._path(key)
+        try:
+            write_json_atomic(path, _encode(entry))
+
+            _, _, timeframe, limit, _ = key
+            for stale in path.parent.glob(f"{timeframe}_{limit}_*.json"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (files on disk are left in place)."""
+        self._memory.clear()
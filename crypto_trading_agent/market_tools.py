@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 import ccxt
+import numpy as np
 
+from . import _async_fetch, _ohlcv_cache
+from ._njit import njit
 from .simulation import GLOBAL_SIMULATOR
 
 
@@ -19,34 +24,173 @@ _FALLBACK_EXCHANGES = [
 ]
 
 
-def _instantiate_exchange(exchange_id: str):
-    """Create a ccxt exchange instance by id with sensible defaults.
+_primary_exchange_id = _FALLBACK_EXCHANGES[0]
+
+# Negative cache for failover: ex_id -> time before which it is skipped, and
+# ex_id -> consecutive network failures (drives the exponential backoff).
+_exchange_cooldown: Dict[str, float] = {}
+_exchange_failures: Dict[str, int] = {}
+_COOLDOWN_BASE_SECONDS = 5.0
+_COOLDOWN_MAX_SECONDS = 300.0
+
+
+def _mark_exchange_failure(ex_id: str) -> None:
+    """Put ``ex_id`` on cooldown for ``min(300, 5 * 2**failures)`` seconds."""
+    failures = _exchange_failures.get(ex_id, 0)
+    _exchange_cooldown[ex_id] = time.time() + min(
+        _COOLDOWN_MAX_SECONDS, _COOLDOWN_BASE_SECONDS * 2**failures
+    )
+    _exchange_failures[ex_id] = failures + 1
+
+
+def _mark_exchange_success(ex_id: str) -> None:
+    """Clear any cooldown for ``ex_id`` after a successful request."""
+    _exchange_cooldown.pop(ex_id, None)
+    _exchange_failures.pop(ex_id, None)
+
+
+def _on_warm_up_error(ex_id: str, exc: BaseException) -> None:
+    """Cool down an exchange whose background warm-up hit a network error."""
+    if isinstance(exc, ccxt.NetworkError):
+        _mark_exchange_failure(ex_id)
+
+
+# Exchanges live on the async fetch loop and are created on first use; start
+# loading the primary's markets now so the first request does not pay for it.
+# A network failure puts the primary on cooldown, so the first query goes
+# straight to the fallbacks instead of paying the timeout again.
+_async_fetch.warm_up(_primary_exchange_id, on_error=_on_warm_up_error)
+
+_OHLCV_CACHE = _ohlcv_cache.FileCache()
+
+# A cached response ends with the still-forming candle, whose close is the
+# live price; serve it for at most this many seconds after it was fetched.
+_OPEN_CANDLE_MAX_AGE = 60.0
+
+# pair -> fetch time of the candles whose close was last sent to the simulator.
+_price_pushed_at: Dict[str, float] = {}
+
+_OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+_CLOSE_GETTER = itemgetter("close")
+
+# Minimum number of candles requested per fetch, so RSI always has history.
+_MIN_CANDLES = 60
+
+# Number of trailing candles echoed back by compute_basic_indicators.
+_CANDLES_TAIL = 20
+
+# (pair, timeframe, last_ts, rsi_period) -> (candle_count, last_close, rsi_out).
+# The agent often re-asks about the same pair within one candle; a hit skips
+# the conversion and RSI pass over identical inputs.
+IndicatorKey = Tuple[str, str, int, int]
+_INDICATOR_CACHE: "OrderedDict[IndicatorKey, Tuple[int, float, np.ndarray]]" = OrderedDict()
+_INDICATOR_CACHE_SIZE = 256
+
+
+def _ohlcv_to_numpy(raw: list) -> np.ndarray:
+    """Convert raw CCXT OHLCV rows into an ``(n, 6)`` float64 array."""
+    return np.asarray(raw, dtype=np.float64).reshape(-1, len(_OHLCV_COLUMNS))
+
+
+def _raw_to_soa(raw: Any) -> Dict[str, np.ndarray]:
+    """Convert a raw CCXT OHLCV response into column arrays.
 
     Parameters
     ----------
-    exchange_id : str
-        Exchange identifier as used by CCXT (lowercase), e.g. 'binance'.
+    raw : list or numpy.ndarray
+        Rows of ``[timestamp, open, high, low, close, volume]`` as returned
+        by ``fetch_ohlcv``.
 
     Returns
     -------
-    Exchange
-        An instantiated CCXT exchange object with `enableRateLimit=True`.
+    dict
+        Structure-of-arrays mapping each column name to a NumPy array:
+        ``timestamp`` as int64 milliseconds, the rest as float64.
+    """
+    arr = _ohlcv_to_numpy(raw)
+    soa = {"timestamp": arr[:, 0].astype(np.int64)}
+    for i, name in enumerate(_OHLCV_COLUMNS[1:], start=1):
+        soa[name] = np.ascontiguousarray(arr[:, i])
+    return soa
+
+
+def _candles_to_closes(candles: List[Dict[str, Any]]) -> np.ndarray:
+    """Extract the ``close`` column of a legacy candle list as float64.
+
+    The list path only needs closes (timestamps for the summary are read
+    from the first and last candle directly), so no other column is
+    converted.
 
     Raises
     ------
-    ValueError
-        If the provided `exchange_id` is not supported by the installed CCXT
-        library.
+    KeyError, TypeError, ValueError
+        If a candle has no ``close`` or it is not numeric.
     """
-    if exchange_id not in ccxt.exchanges:
-        raise ValueError(f"Exchange id not supported by ccxt: {exchange_id}")
-    exchange_cls = getattr(ccxt, exchange_id)
-    return exchange_cls({"enableRateLimit": True})
+    return np.fromiter(
+        map(_CLOSE_GETTER, candles), dtype=np.float64, count=len(candles)
+    )
 
 
-_primary_exchange_id = _FALLBACK_EXCHANGES[0]
-_exchange = _instantiate_exchange(_primary_exchange_id)
-_exchange_instances: Dict[str, Any] = {_primary_exchange_id: _exchange}
+def _soa_to_candles(
+    soa: Dict[str, np.ndarray], start: int = 0
+) -> List[Dict[str, Any]]:
+    """Render column arrays as the list-of-dict candles used by the tools.
+
+    Parameters
+    ----------
+    soa : dict
+        Column arrays as produced by :func:`_raw_to_soa`.
+    start : int, optional
+        Index of the first row to render; ISO timestamps are only formatted
+        for the rendered rows. Defaults to ``0`` (all rows).
+
+    Returns
+    -------
+    list[dict]
+        Candle dicts with keys
+        ``timestamp, time_iso, open, high, low, close, volume``.
+    """
+    ts_arr = soa["timestamp"][start:]
+    iso_arr = np.char.add(
+        ts_arr.astype("datetime64[ms]").astype("datetime64[s]").astype(str), "Z"
+    )
+    columns = [soa[name][start:].tolist() for name in _OHLCV_COLUMNS[1:]]
+    return [
+        {
+            "timestamp": t,
+            "time_iso": iso,
+            "open": o,
+            "high": h,
+            "low": l,
+            "close": c,
+            "volume": v,
+        }
+        for t, iso, o, h, l, c, v in zip(ts_arr.tolist(), iso_arr.tolist(), *columns)
+    ]
+
+
+def _indicator_cache_get(
+    key: Optional[IndicatorKey], n: int, last_close: float
+) -> Optional[np.ndarray]:
+    """Return the cached RSI output for ``key`` if it matches ``n``/``last_close``."""
+    if key is None:
+        return None
+    hit = _INDICATOR_CACHE.get(key)
+    if hit is None or hit[0] != n or hit[1] != last_close:
+        return None
+    _INDICATOR_CACHE.move_to_end(key)
+    return hit[2]
+
+
+def _indicator_cache_set(
+    key: Optional[IndicatorKey], n: int, last_close: float, rsi_out: np.ndarray
+) -> None:
+    if key is None:
+        return
+    _INDICATOR_CACHE[key] = (n, last_close, rsi_out)
+    _INDICATOR_CACHE.move_to_end(key)
+    while len(_INDICATOR_CACHE) > _INDICATOR_CACHE_SIZE:
+        _INDICATOR_CACHE.popitem(last=False)
 
 
 def set_fallback_exchanges(order: list[str]) -> None:
@@ -68,16 +212,184 @@ def set_fallback_exchanges(order: list[str]) -> None:
 
 
 def set_primary_exchange(exchange_id: str) -> None:
-    """Set the primary exchange used for requests (instantiates it).
+    """Set the primary exchange used for requests.
+
+    Only the id is recorded; the exchange is instantiated on the next
+    ``get_ohlcv`` call.
 
     Parameters
     ----------
     exchange_id : str
         Exchange id (lowercase) to use as the primary exchange.
+
+    Raises
+    ------
+    ValueError
+        If the exchange id is not supported by the installed CCXT library.
+    """
+    global _primary_exchange_id
+    exchange_id = exchange_id.lower()
+    if exchange_id not in ccxt.exchanges:
+        raise ValueError(f"Exchange id not supported by ccxt: {exchange_id}")
+    _primary_exchange_id = exchange_id
+
+
+def _candidate_exchanges() -> List[str]:
+    """Return the primary exchange followed by the other fallbacks."""
+    return [_primary_exchange_id] + [
+        e for e in _FALLBACK_EXCHANGES if e != _primary_exchange_id
+    ]
+
+
+def _cached_entry(
+    candidates: List[str], pair: str, timeframe: str, limit: int, now: float
+) -> Optional[Dict[str, Any]]:
+    """Return a fresh cached entry stored under any of ``candidates``.
+
+    Entries are stored under the exchange that answered, which need not be
+    the primary (a fallback can win the race while the primary keeps its
+    role), so every candidate is tried in preference order.
+    """
+    for ex_id in candidates:
+        key = _ohlcv_cache.make_key(ex_id, pair, timeframe, limit, now=now)
+        if key is None:
+            return None
+        entry = _OHLCV_CACHE.get(key, max_age=_OPEN_CANDLE_MAX_AGE, now=now)
+        if entry is not None:
+            return entry
+    return None
+
+
+def get_ohlcv_stream(
+    pair: str,
+    timeframe: str = "1h",
+    limit: int = 200,
+) -> Tuple[Optional[Dict[str, np.ndarray]], Dict[str, Any]]:
+    """Fetch OHLCV candles as column arrays, without building candle dicts.
+
+    This is the array-native core of :func:`get_ohlcv`: it applies the same
+    cache, failover and simulator price update, but hands back the
+    structure-of-arrays form directly so callers such as
+    :func:`compute_basic_indicators_np` never materialize the
+    list-of-dict intermediate.
+
+    Candidate exchanges are raced rather than tried one by one: the
+    primary gets a short head start, after which the fallbacks are queried
+    concurrently and the first success wins (see
+    :func:`._async_fetch.race`). The winner only becomes the new primary if
+    the primary failed or was cooling down. Exchanges that fail with a
+    network error are skipped for a cooldown that doubles with each
+    consecutive failure (5s up to 300s).
+
+    Parameters
+    ----------
+    pair : str
+        Market symbol, for example ``'BTC/USDT'``.
+    timeframe : str, optional
+        Timeframe for OHLCV candles. Defaults to ``'1h'``.
+    limit : int, optional
+        Number of candles to return. Defaults to ``200``.
+
+    Returns
+    -------
+    tuple
+        ``(soa, meta)``. On success ``soa`` maps each of
+        ``timestamp, open, high, low, close, volume`` to a NumPy array and
+        ``meta`` holds ``status, pair, timeframe, exchange``. On failure
+        ``soa`` is ``None`` and ``meta`` is an error response.
+    """
+    global _primary_exchange_id
+
+    if limit < _MIN_CANDLES:
+        limit = _MIN_CANDLES
+
+    now = time.time()
+    candidates = _candidate_exchanges()
+    cached = _cached_entry(candidates, pair, timeframe, limit, now)
+    if cached is not None:
+        return _stream_result(pair, timeframe, cached)
+
+    last_error_messages: List[str] = []
+    live: List[str] = []
+    for ex_id in candidates:
+        retry_at = _exchange_cooldown.get(ex_id, 0.0)
+        if now < retry_at:
+            last_error_messages.append(
+                f"{ex_id}: skipped, cooling down for {retry_at - now:.0f}s "
+                "after recent network failures"
+            )
+        else:
+            live.append(ex_id)
+
+    raw = None
+    used_exchange_id: str | None = None
+    errors: Dict[str, BaseException] = {}
+    if live:
+        try:
+            used_exchange_id, raw, errors = _async_fetch.race(
+                live, pair, timeframe, limit
+            )
+        except Exception as e:
+            last_error_messages.append(f"async fetch: {type(e).__name__}: {e}")
+
+    for ex_id, e in errors.items():
+        if isinstance(e, ccxt.NetworkError):
+            _mark_exchange_failure(ex_id)
+        last_error_messages.append(f"{ex_id}: {type(e).__name__}: {e}")
+
+    if raw is None:
+        return None, {
+            "status": "error",
+            "error_message": (
+                "Failed to fetch OHLCV from all candidate exchanges. "
+                f"Attempts: {last_error_messages}"
+            ),
+        }
+
+    # Only a primary that failed or is cooling down hands over its role; one
+    # that was merely slower than the hedge delay keeps it.
+    primary = candidates[0]
+    if primary in errors or primary not in live:
+        _primary_exchange_id = used_exchange_id
+    _mark_exchange_success(used_exchange_id)
+    entry = {"exchange": used_exchange_id, "soa": _raw_to_soa(raw), "fetched_at": now}
+
+    store_key = _ohlcv_cache.make_key(
+        used_exchange_id, pair, timeframe, limit, now=now
+    )
+    if store_key is not None:
+        _OHLCV_CACHE.set(store_key, entry)
+
+    return _stream_result(pair, timeframe, entry)
+
+
+def _stream_result(
+    pair: str,
+    timeframe: str,
+    entry: Dict[str, Any],
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Pair a cache entry's candles with metadata, updating the simulator.
+
+    The latest close is pushed to the simulator if it has no price for
+    ``pair`` yet (e.g. after a reset) or the entry was fetched after the
+    last price pushed for it. Replaying an older cached close could move
+    the price backwards and trigger stops the market never reached.
     """
-    global _primary_exchange_id, _exchange
-    _primary_exchange_id = exchange_id.lower()
-    _exchange = _instantiate_exchange(_primary_exchange_id)
+    soa = entry["soa"]
+    fetched_at = entry["fetched_at"]
+    if len(soa["close"]) and (
+        pair not in GLOBAL_SIMULATOR.last_prices
+        or fetched_at > _price_pushed_at.get(pair, -np.inf)
+    ):
+        _price_pushed_at[pair] = fetched_at
+        GLOBAL_SIMULATOR.update_price(pair, float(soa["close"][-1]))
+
+    return soa, {
+        "status": "success",
+        "pair": pair,
+        "timeframe": timeframe,
+        "exchange": entry["exchange"],
+    }
 
 
 def get_ohlcv(
@@ -87,6 +399,11 @@ def get_ohlcv(
 ) -> Dict[str, Any]:
     """Fetch OHLCV candles for a symbol and timeframe using CCXT.
 
+    Successful responses are cached in memory and under ``.cache/ohlcv``
+    for up to a minute (never past the current candle), so repeat queries
+    for the same pair and timeframe skip the network round-trip while the
+    still-forming last candle stays close to live.
+
     Parameters
     ----------
     pair : str
@@ -111,80 +428,127 @@ def get_ohlcv(
         On failure returns a dict with ``status: 'error'`` and
         ``error_message`` describing attempts made.
     """
-    global _primary_exchange_id, _exchange
+    soa, meta = get_ohlcv_stream(pair, timeframe=timeframe, limit=limit)
+    if soa is None:
+        return meta
+    meta["candles"] = _soa_to_candles(soa)
+    return meta
 
-    MIN_CANDLES = 60
-    if limit < MIN_CANDLES:
-        limit = MIN_CANDLES
 
-    candidates = [
-        _primary_exchange_id,
-    ] + [e for e in _FALLBACK_EXCHANGES if e != _primary_exchange_id]
-
-    raw = None
-    last_error_messages: List[str] = []
-    used_exchange_id: str | None = None
+def get_ohlcv_multi(
+    pair: str,
+    timeframes: List[str],
+    limit: int = 200,
+    rsi_period: int = 14,
+) -> Dict[str, Any]:
+    """Fetch candles and compute RSI for several timeframes of one pair.
 
-    for ex_id in candidates:
-        try:
-            if ex_id in _exchange_instances:
-                ex = _exchange_instances[ex_id]
-            else:
-                ex = _instantiate_exchange(ex_id)
-                _exchange_instances[ex_id] = ex
-
-            timeframes = getattr(ex, "timeframes", None)
-            if timeframes is not None and timeframe not in timeframes:
-                last_error_messages.append(
-                    f"{ex_id}: timeframe '{timeframe}' not supported"
-                )
-                continue
+    Cache misses are fetched concurrently through a shared
+    ``ccxt.async_support`` session on the primary exchange, so wall-clock
+    time is roughly that of the slowest single request. A timeframe that
+    fails there falls back to :func:`get_ohlcv_stream`, which tries the
+    other exchanges. Indicators are computed on the column arrays with
+    :func:`compute_basic_indicators_np`, so no full candle lists are built.
 
-            raw = ex.fetch_ohlcv(pair, timeframe=timeframe, limit=limit)
-            used_exchange_id = ex_id
-            _primary_exchange_id = ex_id
-            _exchange = ex
-            break
-        except Exception as e:
-            last_error_messages.append(f"{ex_id}: {type(e).__name__}: {e}")
-            raw = None
+    Parameters
+    ----------
+    pair : str
+        Market symbol, for example ``'BTC/USDT'``.
+    timeframes : list[str]
+        Timeframes to fetch, e.g. ``['15m', '1h', '4h']``.
+    limit : int, optional
+        Number of candles per timeframe. Defaults to ``200``.
+    rsi_period : int, optional
+        Lookback period for RSI. Defaults to ``14``.
 
-    if raw is None:
+    Returns
+    -------
+    dict
+        - ``status``: ``'success'`` if at least one timeframe succeeded,
+          otherwise ``'error'``
+        - ``pair``: requested market symbol
+        - ``by_timeframe``: mapping of timeframe to the
+          :func:`compute_basic_indicators` result for that timeframe (plus
+          ``exchange``), or to an error response
+        - ``error_message``: only when every timeframe failed
+    """
+    if not timeframes:
         return {
             "status": "error",
-            "error_message": (
-                "Failed to fetch OHLCV from all candidate exchanges. "
-                f"Attempts: {last_error_messages}"
-            ),
+            "error_message": "get_ohlcv_multi expected a non-empty list of timeframes.",
         }
+    if limit < _MIN_CANDLES:
+        limit = _MIN_CANDLES
+
+    timeframes = list(dict.fromkeys(timeframes))
+    exchange_id = _primary_exchange_id
+    candidates = _candidate_exchanges()
+    now = time.time()
+
+    streams: Dict[str, Tuple[Optional[Dict[str, np.ndarray]], Dict[str, Any]]] = {}
+    misses: List[str] = []
+    for tf in timeframes:
+        cached = _cached_entry(candidates, pair, tf, limit, now)
+        if cached is not None:
+            streams[tf] = _stream_result(pair, tf, cached)
+        else:
+            misses.append(tf)
 
-    candles: List[Dict[str, Any]] = []
-    for ts, o, h, l, c, v in raw:
-        candles.append(
-            {
-                "timestamp": int(ts),
-                "time_iso": time.strftime(
-                    "%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts / 1000)
-                ),
-                "open": float(o),
-                "high": float(h),
-                "low": float(l),
-                "close": float(c),
-                "volume": float(v),
+    if misses:
+        if now < _exchange_cooldown.get(exchange_id, 0.0):
+            # Primary is cooling down; let get_ohlcv_stream fail over instead.
+            results = [(tf, None) for tf in misses]
+        else:
+            try:
+                results = _async_fetch.fetch_many(exchange_id, pair, misses, limit)
+            except Exception as e:
+                results = [(tf, e) for tf in misses]
+            # Only network errors say the exchange is unhealthy; BadSymbol or
+            # NotSupported (ExchangeError subclasses) are about the request
+            # and neither cool it down nor hide a success.
+            if any(isinstance(raw, ccxt.NetworkError) for _, raw in results):
+                _mark_exchange_failure(exchange_id)
+            elif any(isinstance(raw, list) for _, raw in results):
+                _mark_exchange_success(exchange_id)
+
+        for tf, raw in results:
+            if raw is None or isinstance(raw, BaseException):
+                streams[tf] = get_ohlcv_stream(pair, timeframe=tf, limit=limit)
+                continue
+            entry = {
+                "exchange": exchange_id,
+                "soa": _raw_to_soa(raw),
+                "fetched_at": now,
             }
+            key = _ohlcv_cache.make_key(exchange_id, pair, tf, limit, now=now)
+            if key is not None:
+                _OHLCV_CACHE.set(key, entry)
+            streams[tf] = _stream_result(pair, tf, entry)
+
+    by_timeframe: Dict[str, Dict[str, Any]] = {}
+    for tf in timeframes:
+        soa, meta = streams[tf]
+        if soa is None:
+            by_timeframe[tf] = meta
+            continue
+        indicators = compute_basic_indicators_np(
+            soa, rsi_period=rsi_period, pair=pair, timeframe=tf
         )
+        indicators["exchange"] = meta["exchange"]
+        by_timeframe[tf] = indicators
 
-    if candles:
-        last_price = candles[-1]["close"]
-        GLOBAL_SIMULATOR.update_price(pair, last_price)
-
-    return {
-        "status": "success",
+    ok = any(r["status"] == "success" for r in by_timeframe.values())
+    result = {
+        "status": "success" if ok else "error",
         "pair": pair,
-        "timeframe": timeframe,
-        "exchange": used_exchange_id,
-        "candles": candles,
+        "by_timeframe": by_timeframe,
     }
+    if not ok:
+        result["error_message"] = (
+            "Failed to fetch OHLCV for every requested timeframe; "
+            "see by_timeframe for per-timeframe errors."
+        )
+    return result
 
 # RSI + indicator summary helpers
 
@@ -214,19 +578,42 @@ def simple_rsi(prices: list[float], period: int = 14) -> float:
     if len(prices) < period + 1:
         raise ValueError("Not enough data for RSI")
 
-    gains = []
-    losses = []
-    for i in range(1, period + 1):
-        diff = prices[-i] - prices[-i - 1]
-        if diff > 0:
-            gains.append(diff)
-        else:
-            losses.append(-diff)
+    arr = np.asarray(prices[-(period + 1):], dtype=np.float64)
+    return simple_rsi_array(arr, period=period)
+
+
+def simple_rsi_array(closes_np: np.ndarray, period: int = 14) -> float:
+    """Compute a simple RSI value from a NumPy array of closing prices.
+
+    Same calculation as :func:`simple_rsi`, but operates directly on an
+    ``ndarray`` so callers that already hold closes as an array avoid the
+    list round-trip.
 
-    avg_gain = sum(gains) / period if gains else 0.0
-    avg_loss = sum(losses) / period if losses else 0.0
+    Parameters
+    ----------
+    closes_np : numpy.ndarray
+        One-dimensional array of closing prices (oldest first).
+    period : int, optional
+        Lookback period for RSI. Defaults to ``14``.
+
+    Returns
+    -------
+    float
+        RSI value in the range ``0.0`` to ``100.0``.
+
+    Raises
+    ------
+    ValueError
+        If ``closes_np`` holds fewer than ``period + 1`` values.
+    """
+    if closes_np.shape[0] < period + 1:
+        raise ValueError("Not enough data for RSI")
 
-    if avg_loss == 0:
+    d = np.diff(closes_np[-(period + 1):])
+    avg_gain = float(np.maximum(d, 0.0).mean())
+    avg_loss = float((-np.minimum(d, 0.0)).mean())
+
+    if avg_loss == 0.0:
         return 100.0
 
     rs = avg_gain / avg_loss
@@ -234,27 +621,147 @@ def simple_rsi(prices: list[float], period: int = 14) -> float:
     return rsi
 
 
+@njit(cache=True, fastmath=True)
+def _rsi_wilder_loop(closes: np.ndarray, period: int) -> np.ndarray:
+    """Compute the full RSI series using Wilder's smoothing in one pass.
+
+    The first ``period`` diffs seed the average gain/loss; every later bar
+    is folded in with ``avg = (avg * (period - 1) + x) / period``. Gains and
+    losses are split with ``max(diff, 0)`` / ``max(-diff, 0)`` rather than
+    an if/else, so the loop has no data-dependent branch.
+
+    Parameters
+    ----------
+    closes : numpy.ndarray
+        One-dimensional float64 array of closing prices (oldest first).
+    period : int
+        RSI lookback period.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of the same length as ``closes``. Entries before index
+        ``period`` are NaN (not enough history); the rest hold RSI values
+        in the range ``0.0`` to ``100.0``.
+    """
+    n = closes.shape[0]
+    rsi = np.full(n, np.nan)
+    if n < period + 1:
+        return rsi
+
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, period + 1):
+        diff = closes[i] - closes[i - 1]
+        gain += max(diff, 0.0)
+        loss += max(-diff, 0.0)
+    avg_gain = gain / period
+    avg_loss = loss / period
+
+    if avg_loss == 0.0:
+        rsi[period] = 100.0
+    else:
+        rsi[period] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(period + 1, n):
+        diff = closes[i] - closes[i - 1]
+        avg_gain = (avg_gain * (period - 1) + max(diff, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-diff, 0.0)) / period
+        if avg_loss == 0.0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return rsi
+
+
+@njit(cache=True)
+def _rsi14_tail(closes: np.ndarray, k: int) -> np.ndarray:
+    """Wilder RSI specialized for ``period = 14``, returning the last ``k`` values.
+
+    Numerically equivalent to ``_rsi_wilder_loop(closes, 14)[-k:]`` to within
+    floating-point rounding (it multiplies by ``1 / 14`` where the generic
+    kernel divides, and that one is built with ``fastmath``), but with the
+    period baked in as a constant the seed loop has a fixed trip count the
+    compiler can unroll, the smoothing uses constant multipliers, and RSI
+    is only evaluated for the ``k`` bars actually returned. Like the other
+    kernels it compiles lazily on first call (from the on-disk cache when
+    warm), so importing this module never pays for it.
+
+    Parameters
+    ----------
+    closes : numpy.ndarray
+        C-contiguous float64 closes (oldest first); at least 15 values.
+    k : int
+        Number of trailing RSI values to return; at most ``len(closes) - 14``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The last ``k`` RSI values, oldest first.
+    """
+    n = closes.shape[0]
+    out = np.empty(k)
+    first = n - k
+
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, 15):
+        diff = closes[i] - closes[i - 1]
+        gain += max(diff, 0.0)
+        loss += max(-diff, 0.0)
+    avg_gain = gain * (1.0 / 14.0)
+    avg_loss = loss * (1.0 / 14.0)
+
+    if first <= 14:
+        if avg_loss == 0.0:
+            out[14 - first] = 100.0
+        else:
+            out[14 - first] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(15, n):
+        diff = closes[i] - closes[i - 1]
+        avg_gain = (avg_gain * 13.0 + max(diff, 0.0)) * (1.0 / 14.0)
+        avg_loss = (avg_loss * 13.0 + max(-diff, 0.0)) * (1.0 / 14.0)
+        if i >= first:
+            if avg_loss == 0.0:
+                out[i - first] = 100.0
+            else:
+                out[i - first] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+
 def compute_basic_indicators(
     candles: List[Dict[str, Any]],
     rsi_period: int = 14,
     pair: Optional[str] = None,
     timeframe: Optional[str] = None,
+    include_full_candles: bool = False,
 ) -> Dict[str, Any]:
     """
     Compute basic indicators (currently RSI) from OHLCV candles.
 
+    RSI uses Wilder's smoothing over the whole candle history, so the value
+    matches what charting platforms display for the same period.
+
     Parameters
     ----------
     candles : list[dict]
         A list of candle dictionaries, each with keys
         'timestamp', 'time_iso', 'open', 'high', 'low', 'close', 'volume'.
         This should usually be the `candles` list returned by `get_ohlcv`.
+        Internal callers may instead pass the column-array dict returned by
+        ``get_ohlcv_stream``; it is handed to ``compute_basic_indicators_np``.
     rsi_period : int, optional
         Lookback period for RSI. Defaults to 14.
     pair : str, optional
         Market symbol (e.g. 'BTC/USDT'). If omitted, 'UNKNOWN' is used.
     timeframe : str, optional
         Timeframe string (e.g. '1h', '15m'). If omitted, 'UNKNOWN' is used.
+    include_full_candles : bool, optional
+        If True, also return the full candles list and the full RSI series.
+        Defaults to False to keep the response small.
 
     Returns
     -------
@@ -264,13 +771,29 @@ def compute_basic_indicators(
         - pair, timeframe
         - latest_price, latest_time
         - rsi
-        - meta: { candle_count, rsi_period }
-        - candles: the same candles list
+        - meta: { candle_count, rsi_period, rsi_series }, where
+          ``rsi_series`` holds the RSI of the last 20 candles (oldest
+          first), or of every candle from index ``rsi_period`` onwards when
+          ``include_full_candles`` is True
+        - candles_tail: the last 20 candles
+        - candles_summary: { first_ts, last_ts, n }
+        - candles: the full candles list (only if ``include_full_candles``)
         On error:
         - status: "error"
         - error_message: description of the problem.
     """
 
+    if isinstance(candles, dict) and all(
+        isinstance(candles.get(name), np.ndarray) for name in _OHLCV_COLUMNS
+    ):
+        return compute_basic_indicators_np(
+            candles,
+            rsi_period=rsi_period,
+            pair=pair,
+            timeframe=timeframe,
+            include_full_candles=include_full_candles,
+        )
+
     if not isinstance(candles, list) or len(candles) == 0:
         return {
             "status": "error",
@@ -279,8 +802,29 @@ def compute_basic_indicators(
             ),
         }
 
+    cache_key: Optional[IndicatorKey] = None
+    if pair and timeframe and not include_full_candles:
+        try:
+            last = candles[-1]
+            cache_key = (pair, timeframe, int(last["timestamp"]), rsi_period)
+            last_close = float(last["close"])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            cache_key = None
+    if cache_key is not None:
+        rsi_out = _indicator_cache_get(cache_key, len(candles), last_close)
+        if rsi_out is not None:
+            return _indicator_response(
+                pair,
+                timeframe,
+                rsi_period,
+                last_close,
+                rsi_out,
+                candles_tail=candles[-_CANDLES_TAIL:],
+                summary=(candles[0].get("timestamp"), last["timestamp"], len(candles)),
+            )
+
     try:
-        closes = [float(c["close"]) for c in candles]
+        soa = {"close": _candles_to_closes(candles)}
     except Exception as e:
         return {
             "status": "error",
@@ -289,28 +833,171 @@ def compute_basic_indicators(
             ),
         }
 
-    if len(closes) < rsi_period + 1:
+    return _indicators_from_soa(
+        soa,
+        rsi_period,
+        pair,
+        timeframe,
+        include_full_candles,
+        candles=candles,
+        cache_key=cache_key,
+    )
+
+
+def compute_basic_indicators_np(
+    soa: Dict[str, np.ndarray],
+    rsi_period: int = 14,
+    pair: Optional[str] = None,
+    timeframe: Optional[str] = None,
+    include_full_candles: bool = False,
+) -> Dict[str, Any]:
+    """Array-native variant of :func:`compute_basic_indicators`.
+
+    Operates directly on the column arrays returned by
+    :func:`get_ohlcv_stream`; candle dicts are only rendered for the
+    returned tail (or the full list when ``include_full_candles`` is set).
+
+    Parameters
+    ----------
+    soa : dict
+        Column arrays for ``timestamp, open, high, low, close, volume``.
+    rsi_period, pair, timeframe, include_full_candles
+        As for :func:`compute_basic_indicators`.
+
+    Returns
+    -------
+    dict
+        Same shape as the :func:`compute_basic_indicators` response.
+    """
+    if (
+        not isinstance(soa, dict)
+        or any(name not in soa for name in _OHLCV_COLUMNS)
+        or len(soa["close"]) == 0
+    ):
+        return {
+            "status": "error",
+            "error_message": (
+                "compute_basic_indicators_np expected non-empty column arrays for "
+                f"{', '.join(_OHLCV_COLUMNS)}."
+            ),
+        }
+
+    cache_key: Optional[IndicatorKey] = None
+    if pair and timeframe and not include_full_candles:
+        n = len(soa["close"])
+        last_close = float(soa["close"][-1])
+        cache_key = (pair, timeframe, int(soa["timestamp"][-1]), rsi_period)
+        rsi_out = _indicator_cache_get(cache_key, n, last_close)
+        if rsi_out is not None:
+            return _indicator_response(
+                pair,
+                timeframe,
+                rsi_period,
+                last_close,
+                rsi_out,
+                candles_tail=_soa_to_candles(soa, start=max(n - _CANDLES_TAIL, 0)),
+                summary=(int(soa["timestamp"][0]), int(soa["timestamp"][-1]), n),
+            )
+
+    return _indicators_from_soa(
+        soa, rsi_period, pair, timeframe, include_full_candles, cache_key=cache_key
+    )
+
+
+def _indicators_from_soa(
+    soa: Dict[str, np.ndarray],
+    rsi_period: int,
+    pair: Optional[str],
+    timeframe: Optional[str],
+    include_full_candles: bool,
+    candles: Optional[List[Dict[str, Any]]] = None,
+    cache_key: Optional[IndicatorKey] = None,
+) -> Dict[str, Any]:
+    """Shared RSI computation and response building for both entry points.
+
+    ``candles`` is the caller's original list, if any; it is echoed back
+    as-is instead of re-rendering rows from ``soa``. When ``cache_key`` is
+    given, the RSI output is stored in the indicator cache.
+    """
+    closes_np = soa["close"]
+    if np.isnan(closes_np).any():
         return {
             "status": "error",
             "error_message": (
-                f"Not enough candles to compute RSI: got {len(closes)}, "
-                f"need at least {rsi_period + 1}."
+                "Failed to extract 'close' prices from candles: "
+                "found missing or NaN close values."
             ),
         }
 
-    rsi_value = simple_rsi(closes, period=rsi_period)
-    latest = candles[-1]
+    if rsi_period < 1:
+        return {
+            "status": "error",
+            "error_message": f"rsi_period must be at least 1, got {rsi_period}.",
+        }
+
+    if len(closes_np) < rsi_period + 1:
+        return {
+            "status": "error",
+            "error_message": (
+                f"Not enough candles to compute RSI: got {len(closes_np)}, "
+                f"need at least {rsi_period + 1}."
+            ),
+        }
 
+    n = len(closes_np)
+    tail_start = max(n - _CANDLES_TAIL, rsi_period)
+    if rsi_period == 14 and not include_full_candles:
+        rsi_out = _rsi14_tail(
+            np.ascontiguousarray(closes_np, dtype=np.float64), n - tail_start
+        )
+    else:
+        rsi_series = _rsi_wilder_loop(closes_np, rsi_period)
+        rsi_out = rsi_series[rsi_period if include_full_candles else tail_start:]
+    latest_price = float(closes_np[-1])
+    _indicator_cache_set(cache_key, n, latest_price, rsi_out)
+
+    if candles is not None:
+        candles_tail = candles[-_CANDLES_TAIL:]
+        summary = (candles[0].get("timestamp"), candles[-1].get("timestamp"), n)
+    else:
+        candles_tail = _soa_to_candles(soa, start=max(n - _CANDLES_TAIL, 0))
+        summary = (int(soa["timestamp"][0]), int(soa["timestamp"][-1]), n)
+
+    result = _indicator_response(
+        pair, timeframe, rsi_period, latest_price, rsi_out, candles_tail, summary
+    )
+    if include_full_candles:
+        result["candles"] = candles if candles is not None else _soa_to_candles(soa)
+    return result
+
+
+def _indicator_response(
+    pair: Optional[str],
+    timeframe: Optional[str],
+    rsi_period: int,
+    latest_price: float,
+    rsi_out: np.ndarray,
+    candles_tail: List[Dict[str, Any]],
+    summary: Tuple[Any, Any, int],
+) -> Dict[str, Any]:
+    """Assemble the success response; ``summary`` is ``(first_ts, last_ts, n)``."""
+    first_ts, last_ts, n = summary
     return {
         "status": "success",
         "pair": pair or "UNKNOWN",
         "timeframe": timeframe or "UNKNOWN",
-        "latest_price": float(latest["close"]),
-        "latest_time": latest.get("time_iso"),
-        "rsi": rsi_value,
+        "latest_price": latest_price,
+        "latest_time": candles_tail[-1].get("time_iso"),
+        "rsi": float(rsi_out[-1]),
         "meta": {
-            "candle_count": len(candles),
+            "candle_count": n,
             "rsi_period": rsi_period,
+            "rsi_series": rsi_out.tolist(),
+        },
+        "candles_tail": candles_tail,
+        "candles_summary": {
+            "first_ts": first_ts,
+            "last_ts": last_ts,
+            "n": n,
         },
-        "candles": candles,
     }
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import bisect
 import datetime
-import uuid
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional
+import itertools
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 
-@dataclass
+from ._njit import NUMBA_AVAILABLE, njit
+
+
+@dataclass(slots=True)
 class SimPosition:
     """Dataclass representing a simulated spot trading position.
 
     Attributes
     ----------
     id : str
-        Unique identifier for the position.
+        Unique identifier for the position, of the form ``'p<n>'``.
     pair : str
         Market symbol, e.g. 'BTC/USDT'.
     side : str
@@ -28,12 +36,12 @@ class SimPosition:
         Stop-loss price, if any.
     take_profit : Optional[float]
         Take-profit price, if any.
-    opened_at : datetime.datetime
-        Timestamp when the position was opened (UTC).
+    opened_at : float
+        Time the position was opened, in epoch seconds.
     status : str
         'open' or 'closed'.
-    closed_at : Optional[datetime.datetime]
-        Timestamp when the position was closed (UTC), if closed.
+    closed_at : Optional[float]
+        Time the position was closed, in epoch seconds, if closed.
     close_price : Optional[float]
         Price at which the position was closed.
     pnl : Optional[float]
@@ -46,36 +54,325 @@ class SimPosition:
     notional: float
     stop_loss: Optional[float]
     take_profit: Optional[float]
-    opened_at: datetime.datetime
+    opened_at: float
     status: str = "open"
-    closed_at: Optional[datetime.datetime] = None
+    closed_at: Optional[float] = None
     close_price: Optional[float] = None
     pnl: Optional[float] = None
 
 
+def _reciprocal(x: float) -> float:
+    """Return ``1 / x``, or ``inf`` for zero instead of raising."""
+    return 1.0 / x if x else math.inf
+
+
+def iso_utc(ts: Optional[float]) -> Optional[str]:
+    """Format epoch seconds as an ISO-8601 UTC string (``None`` passes through)."""
+    if ts is None:
+        return None
+    return datetime.datetime.fromtimestamp(ts, datetime.timezone.utc).isoformat()
+
+
+def _parse_position_id(pos_id: str | int) -> Optional[int]:
+    """Map ``'p<n>'`` (or ``n``) to the internal integer id, else ``None``."""
+    if isinstance(pos_id, int):
+        return pos_id
+    if isinstance(pos_id, str) and pos_id[:1] == "p" and pos_id[1:].isdigit():
+        return int(pos_id[1:])
+    return None
+
+
+def _position_to_dict(pos: SimPosition) -> dict:
+    """Return ``pos`` as a dict with ISO-8601 timestamps.
+
+    All fields are scalars, so reading them directly avoids the recursion
+    and ``deepcopy`` done by ``dataclasses.asdict``.
+    """
+    return {
+        "id": pos.id,
+        "pair": pos.pair,
+        "side": pos.side,
+        "entry_price": pos.entry_price,
+        "notional": pos.notional,
+        "stop_loss": pos.stop_loss,
+        "take_profit": pos.take_profit,
+        "opened_at": iso_utc(pos.opened_at),
+        "status": pos.status,
+        "closed_at": iso_utc(pos.closed_at),
+        "close_price": pos.close_price,
+        "pnl": pos.pnl,
+    }
+
+
+@njit(cache=True)
+def _bulk_tick_kernel(slot_pair, side, sl, tp, mark, inv_mark, tick_pair, tick_price):
+    """Apply a sequence of ticks to the live slots and collect SL/TP hits.
+
+    For each tick ``(tick_pair[t], tick_price[t])`` in order, refreshes the
+    pair's mark (``mark``/``inv_mark``, in place) and records not-yet-
+    triggered slots on that pair whose stop or target is crossed, i.e.
+    ``sgn * (sl - price) >= 0`` or ``sgn * (price - tp) >= 0`` with
+    ``sgn = side``. A slot triggers at most once, at its first crossing.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(hit_slots, hit_ticks)``: each triggered slot and the index of the
+        tick that triggered it, in tick order (slot order within a tick).
+    """
+    n = slot_pair.shape[0]
+    hit_slots = np.empty(n, dtype=np.int64)
+    hit_ticks = np.empty(n, dtype=np.int64)
+    done = np.zeros(n, dtype=np.bool_)
+    k = 0
+    for t in range(tick_pair.shape[0]):
+        pid = tick_pair[t]
+        if pid < 0:
+            continue
+        price = tick_price[t]
+        mark[pid] = price
+        inv_mark[pid] = 1.0 / price if price != 0.0 else np.inf
+        for i in range(n):
+            if slot_pair[i] != pid or done[i]:
+                continue
+            sgn = side[i]
+            if sgn * (sl[i] - price) >= 0.0 or sgn * (price - tp[i]) >= 0.0:
+                done[i] = True
+                hit_slots[k] = i
+                hit_ticks[k] = t
+                k += 1
+    return hit_slots[:k], hit_ticks[:k]
+
+
+class _TriggerBook:
+    """Sorted stop-loss/take-profit levels of one pair's open positions.
+
+    Each list holds ``(price, position_id)`` tuples in ascending order, so
+    the positions crossed by a tick form a prefix or suffix that bisection
+    finds in ``O(log n)``.
+    """
+
+    __slots__ = ("long_sl", "long_tp", "short_sl", "short_tp")
+
+    def __init__(self) -> None:
+        self.long_sl: List[Tuple[float, int]] = []
+        self.long_tp: List[Tuple[float, int]] = []
+        self.short_sl: List[Tuple[float, int]] = []
+        self.short_tp: List[Tuple[float, int]] = []
+
+    def _levels(self, side: int) -> Tuple[list, list]:
+        if side > 0:
+            return self.long_sl, self.long_tp
+        return self.short_sl, self.short_tp
+
+    def add(self, pos_id: int, side: int, sl: float, tp: float) -> None:
+        """Register a position's SL/TP; NaN levels are not stored."""
+        for levels, level in zip(self._levels(side), (sl, tp)):
+            if not math.isnan(level):
+                bisect.insort(levels, (level, pos_id))
+
+    def remove(self, pos_id: int, side: int, sl: float, tp: float) -> None:
+        """Drop a position's SL/TP, given the same values passed to :meth:`add`."""
+        for levels, level in zip(self._levels(side), (sl, tp)):
+            if not math.isnan(level):
+                del levels[bisect.bisect_left(levels, (level, pos_id))]
+
+    def crossed(self, price: float) -> List[int]:
+        """Return ids of positions whose stop or target `price` reaches.
+
+        Longs stop out at ``sl >= price`` and take profit at ``tp <= price``;
+        shorts mirror that. Each id appears once, in ascending order; ids
+        only ever increase, so that is the order the positions were opened.
+        """
+        if math.isnan(price):
+            return []
+        below = (price, -1)  # sorts before every (price, id)
+        above = (price, math.inf)  # sorts after every (price, id)
+        hits = self.long_sl[bisect.bisect_left(self.long_sl, below) :]
+        hits += self.long_tp[: bisect.bisect_right(self.long_tp, above)]
+        hits += self.short_sl[: bisect.bisect_right(self.short_sl, above)]
+        hits += self.short_tp[bisect.bisect_left(self.short_tp, below) :]
+        return sorted({pid for _, pid in hits})
+
+
 class TradingSimulator:
     """
     Very simple portfolio simulator for spot trading.
     - Uses 'notional' as the amount of quote currency committed per trade.
     - PnL is measured in the same quote currency (e.g. USDT).
+
+    Open positions are stored as a structure of arrays: slot ``i`` of
+    ``_entry``, ``_notional``, ``_sl``, ``_tp`` and ``_side`` (``+1`` long,
+    ``-1`` short) describes one position, with NaN standing in for a missing
+    stop-loss/take-profit, and ``_opened_at`` holds epoch seconds. Marks are
+    kept per pair: ``_slot_pair_id`` maps each slot to a small pair id that
+    indexes ``_pair_mark``/``_pair_inv_mark``, so a tick is an O(1) mark
+    update and equity is a single gathered, division-free reduction
+    (``_inv_entry`` caches ``1 / entry``). Each pair's SL/TP levels are also
+    kept sorted in a :class:`_TriggerBook`, so a tick only visits the
+    positions it actually crosses. Slots ``[0, _n)`` are live; closing a
+    position moves the last slot into the freed one. ``SimPosition`` objects
+    are only built when a position is closed or serialized, and timestamps
+    only become ISO strings in serialized output.
+
+    Only the most recent ``_HISTORY_CAPACITY`` closed trades are kept in
+    ``trade_history`` (their PnLs in the ``_pnl_ring`` ring buffer), so long
+    runs use bounded memory; realized PnL and trade counts still cover every
+    trade since the last reset.
     """
 
+    _INITIAL_CAPACITY = 16
+    _HISTORY_CAPACITY = 10_000
+    _SLOT_ARRAYS = (
+        ("_entry", np.float64),
+        ("_inv_entry", np.float64),
+        ("_notional", np.float64),
+        ("_sl", np.float64),
+        ("_tp", np.float64),
+        ("_side", np.int8),
+        ("_opened_at", np.float64),
+        ("_slot_pair_id", np.int64),
+    )
+
     def __init__(self, initial_balance: float = 10_000.0):
         self.initial_balance = float(initial_balance)
         self.cash = float(initial_balance)
-        self.positions: Dict[str, SimPosition] = {}
-        self.trade_history: List[SimPosition] = []
+        self.trade_history: Deque[SimPosition] = deque(maxlen=self._HISTORY_CAPACITY)
         self.last_prices: Dict[str, float] = {}
+        self._equity_cache: Optional[float] = None
+        # Position ids are plain ints internally and shown as "p<n>". The
+        # counter survives reset() so an old id never names a new position.
+        self._next_id = 1
+        self._alloc(self._INITIAL_CAPACITY)
+        self._reset_closed_stats()
+
+    def _reset_closed_stats(self) -> None:
+        """Clear the running aggregates over closed trades."""
+        self._realized_pnl_total = 0.0
+        self._wins_total = 0
+        self._losses_total = 0
+        # Ring of the last _HISTORY_CAPACITY PnLs, parallel to trade_history.
+        # Trade k (0-based, all-time) is written at k % cap and mirrored at
+        # k % cap + cap, so any window of <= cap trades is one contiguous view.
+        self._pnl_ring = np.empty(2 * self._HISTORY_CAPACITY, dtype=np.float64)
+        self._n_closed = 0
+
+    def _record_close(self, pos: SimPosition) -> None:
+        """Append a closed position to the history and update the aggregates."""
+        pnl = pos.pnl
+        self.trade_history.append(pos)
+        self._realized_pnl_total += pnl
+        if pnl > 0:
+            self._wins_total += 1
+        elif pnl < 0:
+            self._losses_total += 1
+        slot = self._n_closed % self._HISTORY_CAPACITY
+        self._pnl_ring[slot] = pnl
+        self._pnl_ring[slot + self._HISTORY_CAPACITY] = pnl
+        self._n_closed += 1
+
+    def _pnl_ring_tail(self, count: int) -> np.ndarray:
+        """Return a view of the last `count` retained PnLs, oldest first."""
+        end = self._n_closed % self._HISTORY_CAPACITY + self._HISTORY_CAPACITY
+        return self._pnl_ring[end - count : end]
+
+    def _alloc(self, capacity: int) -> None:
+        """Drop all open positions and allocate empty slot arrays."""
+        self._n = 0
+        self._total_open_notional = 0.0
+        for name, dtype in self._SLOT_ARRAYS:
+            setattr(self, name, np.empty(capacity, dtype=dtype))
+        # Slot -> position id, position id -> slot, and position id -> pair.
+        # Ids only grow and closed ones are deleted, so _pos_idx iterates in
+        # open order even though swap-removal reorders the slots.
+        self._slot_ids: List[int] = []
+        self._pos_idx: Dict[int, int] = {}
+        self._pair_of: Dict[int, str] = {}
+        # Pair -> small int id, the per-pair mark and 1/mark indexed by that
+        # id (NaN until the pair is priced), and the pair's sorted SL/TP.
+        self._pair_id: Dict[str, int] = {}
+        self._pair_mark = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._pair_inv_mark = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._triggers: Dict[str, _TriggerBook] = {}
+
+    def _grow(self) -> None:
+        """Double the capacity of the slot arrays."""
+        capacity = 2 * len(self._entry)
+        for name, _ in self._SLOT_ARRAYS:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._n] = old[: self._n]
+            setattr(self, name, new)
+
+    def _pair_index(self, pair: str) -> int:
+        """Return the int id of `pair`, assigning one (and its mark) if new."""
+        pid = self._pair_id.get(pair)
+        if pid is None:
+            pid = len(self._pair_id)
+            if pid == len(self._pair_mark):
+                for name in ("_pair_mark", "_pair_inv_mark"):
+                    old = getattr(self, name)
+                    new = np.empty(2 * pid, dtype=np.float64)
+                    new[:pid] = old
+                    setattr(self, name, new)
+            mark = self.last_prices.get(pair, math.nan)
+            self._pair_mark[pid] = mark
+            self._pair_inv_mark[pid] = _reciprocal(mark)
+            self._pair_id[pair] = pid
+            self._triggers[pair] = _TriggerBook()
+        return pid
+
+    def _position_at(self, idx: int) -> SimPosition:
+        """Build an open ``SimPosition`` from slot ``idx``."""
+        pos_id = self._slot_ids[idx]
+        sl = float(self._sl[idx])
+        tp = float(self._tp[idx])
+        return SimPosition(
+            id=f"p{pos_id}",
+            pair=self._pair_of[pos_id],
+            side="long" if self._side[idx] > 0 else "short",
+            entry_price=float(self._entry[idx]),
+            notional=float(self._notional[idx]),
+            stop_loss=None if np.isnan(sl) else sl,
+            take_profit=None if np.isnan(tp) else tp,
+            opened_at=float(self._opened_at[idx]),
+        )
+
+    def _remove_slot(self, idx: int) -> None:
+        """Free slot ``idx`` by moving the last live slot into it."""
+        last = self._n - 1
+        pos_id = self._slot_ids[idx]
+        self._triggers[self._pair_of[pos_id]].remove(
+            pos_id, int(self._side[idx]), float(self._sl[idx]), float(self._tp[idx])
+        )
+        if idx != last:
+            for name, _ in self._SLOT_ARRAYS:
+                arr = getattr(self, name)
+                arr[idx] = arr[last]
+            moved_id = self._slot_ids[last]
+            self._slot_ids[idx] = moved_id
+            self._pos_idx[moved_id] = idx
+        self._slot_ids.pop()
+        del self._pos_idx[pos_id]
+        del self._pair_of[pos_id]
+        self._n = last
+
+    @property
+    def positions(self) -> Dict[str, SimPosition]:
+        """Open positions keyed by id, in open order, built from the slot arrays."""
+        return {
+            f"p{pid}": self._position_at(idx) for pid, idx in self._pos_idx.items()
+        }
 
-    def _now(self) -> datetime.datetime:
-        """Return the current UTC datetime.
+    def _now(self) -> float:
+        """Return the current time in epoch seconds.
 
         Returns
         -------
-        datetime.datetime
-            Current UTC datetime.
+        float
+            Seconds since the epoch, as from ``time.time()``.
         """
-        return datetime.datetime.utcnow()
+        return time.time()
 
     def _equity(self) -> float:
         """Compute total equity as cash plus unrealized PnL.
@@ -85,21 +382,45 @@ class TradingSimulator:
         float
             Total account equity in quote currency.
         """
-        unrealized = 0.0
-        for pos in self.positions.values():
-            price = self.last_prices.get(pos.pair)
-            if price is None or pos.status != "open":
-                continue
-            unrealized += self._calc_pnl_price(pos, price)
-        return self.cash + unrealized
+        n = self._n
+        if n == 0:
+            return self.cash
+        pair_ids = self._slot_pair_id[:n]
+        # Long: mark/entry, short: entry/mark, both as products.
+        ret = (
+            np.where(
+                self._side[:n] > 0,
+                self._pair_mark[pair_ids] * self._inv_entry[:n],
+                self._entry[:n] * self._pair_inv_mark[pair_ids],
+            )
+            - 1.0
+        )
+        # Positions on a pair that was never priced (NaN mark) carry no PnL.
+        ret = np.where(np.isnan(ret), 0.0, ret)
+        return self.cash + float(np.vdot(self._notional[:n], ret))
+
+    def equity(self) -> float:
+        """Return total equity without building the full portfolio state.
+
+        The value is memoized and invalidated whenever a price update,
+        order, close or reset changes cash or marks.
+
+        Returns
+        -------
+        float
+            Total account equity in quote currency.
+        """
+        if self._equity_cache is None:
+            self._equity_cache = self._equity()
+        return self._equity_cache
 
-    def _calc_pnl_price(self, pos: SimPosition, price: float) -> float:
-        """Calculate PnL for a position at a given market `price`.
+    def _slot_pnl(self, idx: int, price: float) -> float:
+        """Calculate PnL for the position in slot ``idx`` at market `price`.
 
         Parameters
         ----------
-        pos : SimPosition
-            Open position to evaluate.
+        idx : int
+            Slot of the open position to evaluate.
         price : float
             Market price to use for PnL calculation.
 
@@ -108,10 +429,11 @@ class TradingSimulator:
         float
             Unrealized PnL in quote currency (can be negative).
         """
-        if pos.side == "long":
-            return pos.notional * (price / pos.entry_price - 1.0)
-        else:
-            return pos.notional * (pos.entry_price / price - 1.0)
+        # ratio ** sign is price/entry for longs and entry/price for shorts.
+        # Realized PnL keeps the exact division (see _equity for the
+        # reciprocal form) so a close at the entry price books exactly 0.
+        ratio = price / float(self._entry[idx])
+        return float(self._notional[idx]) * (ratio ** int(self._side[idx]) - 1.0)
 
     def reset(self, initial_balance: Optional[float] = None) -> None:
         """Reset the simulator state.
@@ -125,9 +447,11 @@ class TradingSimulator:
         if initial_balance is not None:
             self.initial_balance = float(initial_balance)
         self.cash = float(self.initial_balance)
-        self.positions.clear()
+        self._alloc(self._INITIAL_CAPACITY)
         self.trade_history.clear()
+        self._reset_closed_stats()
         self.last_prices.clear()
+        self._equity_cache = None
 
     def update_price(self, pair: str, price: float) -> None:
         """Update the last price for a market and evaluate SL/TP.
@@ -139,11 +463,79 @@ class TradingSimulator:
         price : float
             Latest market price for the `pair`.
         """
-        self.last_prices[pair] = float(price)
-        for pos in list(self.positions.values()):
-            if pos.pair != pair or pos.status != "open":
-                continue
-            self._check_and_maybe_close(pos, price)
+        price = float(price)
+        self.last_prices[pair] = price
+        self._equity_cache = None
+        pid = self._pair_id.get(pair)
+        if pid is None:
+            return
+        self._pair_mark[pid] = price
+        self._pair_inv_mark[pid] = _reciprocal(price)
+
+        # The trigger book yields only the crossed positions; it returns a
+        # fresh list, so closing (which edits the book) is safe here.
+        for pos_id in self._triggers[pair].crossed(price):
+            self.close_position(pos_id, price=price)
+
+    def update_prices_bulk(
+        self, pairs: Sequence[str], prices: Sequence[float]
+    ) -> None:
+        """Apply many price ticks at once, in order.
+
+        Equivalent to calling :meth:`update_price` for each
+        ``(pairs[i], prices[i])``, but when numba is available the SL/TP
+        checks and mark updates for all ticks run in one compiled loop and
+        only the triggered positions are closed from Python.
+
+        Parameters
+        ----------
+        pairs : sequence of str
+            Market symbol of each tick (a list or NumPy string array).
+        prices : sequence of float
+            Price of each tick, aligned with `pairs`.
+
+        Raises
+        ------
+        ValueError
+            If `pairs` and `prices` differ in length.
+        """
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        if len(pairs) != len(prices):
+            raise ValueError("pairs and prices must have the same length")
+        pairs = [str(p) for p in pairs]
+
+        if not NUMBA_AVAILABLE or self._n == 0:
+            for pair, price in zip(pairs, prices.tolist()):
+                self.update_price(pair, price)
+            return
+
+        for pair, price in zip(pairs, prices.tolist()):
+            self.last_prices[pair] = price
+        self._equity_cache = None
+
+        n = self._n
+        tick_pair = np.fromiter(
+            (self._pair_id.get(p, -1) for p in pairs), dtype=np.int64, count=len(pairs)
+        )
+        hit_slots, hit_ticks = _bulk_tick_kernel(
+            self._slot_pair_id[:n],
+            self._side[:n],
+            self._sl[:n],
+            self._tp[:n],
+            self._pair_mark,
+            self._pair_inv_mark,
+            tick_pair,
+            prices,
+        )
+        # Closing reshuffles slots, so resolve the triggered ids first, then
+        # close tick by tick and, within a tick, in open (id) order as
+        # update_price does.
+        slot_ids = self._slot_ids
+        hits = sorted(
+            zip(hit_ticks.tolist(), [slot_ids[i] for i in hit_slots.tolist()])
+        )
+        for tick, pos_id in hits:
+            self.close_position(pos_id, price=float(prices[tick]))
 
     def place_order(
         self,
@@ -203,26 +595,40 @@ class TradingSimulator:
             entry_price = price
 
         self.cash -= notional
-        pos = SimPosition(
-            id=str(uuid.uuid4()),
-            pair=pair,
-            side=side,
-            entry_price=float(entry_price),
-            notional=notional,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
-            opened_at=self._now(),
+        self._equity_cache = None
+
+        if self._n == len(self._entry):
+            self._grow()
+        idx = self._n
+        pos_id = self._next_id
+        self._next_id += 1
+        self._entry[idx] = float(entry_price)
+        self._inv_entry[idx] = _reciprocal(float(entry_price))
+        self._notional[idx] = notional
+        self._total_open_notional += notional
+        self._sl[idx] = np.nan if stop_loss is None else float(stop_loss)
+        self._tp[idx] = np.nan if take_profit is None else float(take_profit)
+        self._side[idx] = 1 if side == "long" else -1
+        self._opened_at[idx] = self._now()
+        self._slot_pair_id[idx] = self._pair_index(pair)
+        self._triggers[pair].add(
+            pos_id, int(self._side[idx]), float(self._sl[idx]), float(self._tp[idx])
         )
-        self.positions[pos.id] = pos
-        return pos
-
-    def close_position(self, pos_id: str, price: Optional[float] = None) -> SimPosition:
+        self._slot_ids.append(pos_id)
+        self._pos_idx[pos_id] = idx
+        self._pair_of[pos_id] = pair
+        self._n = idx + 1
+        return self._position_at(idx)
+
+    def close_position(
+        self, pos_id: str | int, price: Optional[float] = None
+    ) -> SimPosition:
         """Close an open position and realize PnL.
 
         Parameters
         ----------
-        pos_id : str
-            Identifier of the position to close.
+        pos_id : str or int
+            Identifier of the position to close, as ``'p<n>'`` or ``n``.
         price : float, optional
             Exit price. If omitted, uses the last known price for the
             position's market.
@@ -239,104 +645,134 @@ class TradingSimulator:
         ValueError
             If no price is available to close the position.
         """
-        if pos_id not in self.positions:
+        pid = _parse_position_id(pos_id)
+        idx = self._pos_idx.get(pid)
+        if idx is None:
             raise KeyError(f"Position {pos_id} not found")
 
-        pos = self.positions[pos_id]
-        if pos.status != "open":
-            return pos
+        pair = self._pair_of[pid]
 
         if price is None:
-            price = self.last_prices.get(pos.pair)
+            price = self.last_prices.get(pair)
             if price is None:
                 raise ValueError(
-                    f"No last price for {pos.pair}. Call update_price or pass price."
+                    f"No last price for {pair}. Call update_price or pass price."
                 )
 
         price = float(price)
-        pnl = self._calc_pnl_price(pos, price)
-        self.cash += pos.notional + pnl
+        pnl = self._slot_pnl(idx, price)
+        self.cash += float(self._notional[idx]) + pnl
+        self._equity_cache = None
 
+        pos = self._position_at(idx)
         pos.status = "closed"
         pos.closed_at = self._now()
         pos.close_price = price
         pos.pnl = pnl
 
-        self.trade_history.append(pos)
-        del self.positions[pos_id]
+        self._record_close(pos)
+        self._remove_slot(idx)
+        # Snap to exactly 0 once flat so float drift never shows as exposure.
+        self._total_open_notional = (
+            self._total_open_notional - pos.notional if self._n else 0.0
+        )
         return pos
 
-    def _check_and_maybe_close(self, pos: SimPosition, price: float) -> None:
-        """Check a position against SL/TP and close it if a trigger is hit.
+    def portfolio_summary(self) -> dict:
+        """Return the portfolio's headline numbers without serializing positions.
 
-        Parameters
-        ----------
-        pos : SimPosition
-            Position to evaluate.
-        price : float
-            Current market price for the position's pair.
+        Returns
+        -------
+        dict
+            Initial balance, cash, equity, realized PnL, open and closed
+            trade counts, and the total notional committed to open positions.
         """
-        hit_sl = pos.stop_loss is not None and (
-            (pos.side == "long" and price <= pos.stop_loss)
-            or (pos.side == "short" and price >= pos.stop_loss)
-        )
-        hit_tp = pos.take_profit is not None and (
-            (pos.side == "long" and price >= pos.take_profit)
-            or (pos.side == "short" and price <= pos.take_profit)
-        )
-
-        if hit_sl or hit_tp:
-            self.close_position(pos.id, price=price)
+        return {
+            "initial_balance": self.initial_balance,
+            "cash": self.cash,
+            "equity": self.equity(),
+            "realized_pnl": self._realized_pnl_total,
+            "open_count": self._n,
+            "trade_count": self._n_closed,
+            "total_notional_committed": self._total_open_notional,
+        }
 
-    def portfolio_state(self) -> dict:
+    def portfolio_state(self, include_positions: bool = True) -> dict:
         """Return a dictionary summarizing current portfolio state.
 
+        Parameters
+        ----------
+        include_positions : bool, optional
+            If False, omit the serialized ``open_positions`` list (see also
+            :meth:`portfolio_summary`). Defaults to True.
+
         Returns
         -------
         dict
             Summary including initial balance, cash, equity, open positions,
             realized PnL and trade counts.
         """
-        open_positions = [asdict(p) for p in self.positions.values()]
-        realized_pnl = sum((p.pnl or 0.0) for p in self.trade_history)
-        return {
+        state = {
             "initial_balance": self.initial_balance,
             "cash": self.cash,
-            "equity": self._equity(),
-            "open_positions": open_positions,
-            "realized_pnl": realized_pnl,
-            "open_count": len(open_positions),
-            "trade_count": len(self.trade_history),
+            "equity": self.equity(),
         }
-
-    def trade_history_summary(self, limit: int = 50) -> dict:
+        if include_positions:
+            # Slot order is scrambled by swap-removal; _pos_idx keeps open order.
+            state["open_positions"] = [
+                _position_to_dict(self._position_at(idx))
+                for idx in self._pos_idx.values()
+            ]
+        state["realized_pnl"] = self._realized_pnl_total
+        state["open_count"] = self._n
+        state["trade_count"] = self._n_closed
+        return state
+
+    def trade_history_summary(
+        self, limit: int = 50, include_trades: bool = True
+    ) -> dict:
         """Return a summary of recent trades.
 
         Parameters
         ----------
         limit : int, optional
-            Maximum number of recent trades to include. Defaults to ``50``.
+            Maximum number of recent trades to include; ``0`` means every
+            retained trade. Defaults to ``50``.
+        include_trades : bool, optional
+            If False, only compute the statistics and omit the serialized
+            ``trades`` list. Defaults to True.
 
         Returns
         -------
         dict
-            Summary including counts, win rate, total PnL and serialized trades.
+            Summary including counts, win rate, total PnL and, if requested,
+            serialized trades.
         """
-        trades = self.trade_history[-limit:]
-        wins = sum(1 for t in trades if (t.pnl or 0.0) > 0)
-        losses = sum(1 for t in trades if (t.pnl or 0.0) < 0)
-        total = len(trades)
+        retained = len(self.trade_history)
+        total = retained if limit <= 0 else min(limit, retained)
+        if total == self._n_closed:
+            # The window covers the whole history: use the running totals.
+            wins = self._wins_total
+            losses = self._losses_total
+            total_pnl = self._realized_pnl_total
+        else:
+            tail = self._pnl_ring_tail(total)
+            wins = int(np.count_nonzero(tail > 0))
+            losses = int(np.count_nonzero(tail < 0))
+            total_pnl = float(tail.sum())
         win_rate = wins / total if total > 0 else 0.0
-        total_pnl = sum((t.pnl or 0.0) for t in trades)
 
-        return {
+        summary = {
             "total_trades": total,
             "wins": wins,
             "losses": losses,
             "win_rate": win_rate,
             "total_pnl": total_pnl,
-            "trades": [asdict(t) for t in trades],
         }
+        if include_trades:
+            trades = itertools.islice(reversed(self.trade_history), total)
+            summary["trades"] = [_position_to_dict(t) for t in trades][::-1]
+        return summary
 
 
 GLOBAL_SIMULATOR = TradingSimulator(initial_balance=10_000.0)
@@ -344,21 +780,29 @@ GLOBAL_SIMULATOR = TradingSimulator(initial_balance=10_000.0)
 # Evaluation & debugging helper tools
 
 
-def eval_strategy_quality(limit: int = 50) -> Dict[str, Any]:
+def eval_strategy_quality(
+    limit: int = 50, return_trades: bool = False
+) -> Dict[str, Any]:
     """Compute simple quality metrics for recent simulated trades.
 
     Parameters
     ----------
     limit : int, optional
         Number of recent trades to analyze. Defaults to ``50``.
+    return_trades : bool, optional
+        If True, also return the analyzed trades as ``raw_trades``.
+        Defaults to False; ``sim_trade_history`` lists them as well.
 
     Returns
     -------
     dict
-        Response containing a status, aggregated metrics and raw trades.
+        Response containing a status, aggregated metrics and, if requested,
+        raw trades.
     """
-    summary = GLOBAL_SIMULATOR.trade_history_summary(limit=limit)
-    return {
+    summary = GLOBAL_SIMULATOR.trade_history_summary(
+        limit=limit, include_trades=return_trades
+    )
+    response = {
         "status": "success",
         "metrics": {
             "total_trades": summary["total_trades"],
@@ -367,8 +811,10 @@ def eval_strategy_quality(limit: int = 50) -> Dict[str, Any]:
             "win_rate": summary["win_rate"],
             "total_pnl": summary["total_pnl"],
         },
-        "raw_trades": summary["trades"],
     }
+    if return_trades:
+        response["raw_trades"] = summary["trades"]
+    return response
 
 
 def eval_last_error_context() -> Dict[str, Any]:
@@ -419,8 +865,7 @@ def suggest_notional_from_risk(
         - message: explanation
     """
     try:
-        portfolio = GLOBAL_SIMULATOR.portfolio_state()
-        equity = float(portfolio["equity"])
+        equity = GLOBAL_SIMULATOR.equity()
         if equity <= 0:
             return {
                 "status": "error",
@@ -476,15 +921,16 @@ def explain_current_exposure() -> Dict[str, Any]:
     High-level summary of current portfolio exposure to help the LM
     explain the situation to the user.
     """
+    # The open positions are part of the answer ("what am I holding?"), so
+    # the full state is still returned; only the totals come from the summary.
     portfolio = GLOBAL_SIMULATOR.portfolio_state()
-    open_positions = portfolio["open_positions"]
-    total_notional_committed = sum(p["notional"] for p in open_positions)
+    summary = GLOBAL_SIMULATOR.portfolio_summary()
 
     return {
         "status": "success",
         "portfolio": portfolio,
         "exposure": {
-            "open_positions_count": portfolio["open_count"],
-            "total_notional_committed": total_notional_committed,
+            "open_positions_count": summary["open_count"],
+            "total_notional_committed": summary["total_notional_committed"],
         },
     }
@@ -0,0 +1,92 @@
+# tests/test_async_fetch.py
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import ccxt
+
+from crypto_trading_agent import _async_fetch
+
+
+class _FakeExchange:
+    def __init__(self, ex_id: str, delay: float):
+        self.id = ex_id
+        self.delay = delay
+
+    async def fetch_ohlcv(self, pair, timeframe, limit):
+        await asyncio.sleep(self.delay)
+        return [[0, 1.0, 1.0, 1.0, 1.0, 1.0]] * limit
+
+    async def close(self):
+        pass
+
+
+class RaceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # ex_id -> (creation delay, fetch delay)
+        self.delays = {"slow": (0.0, 0.0), "fast": (0.0, 0.05)}
+
+        async def fake_create(ex_id):
+            if self.delays[ex_id] is None:
+                raise ccxt.RequestTimeout(f"{ex_id} timed out loading markets")
+            create_delay, fetch_delay = self.delays[ex_id]
+            await asyncio.sleep(create_delay)
+            entry = (_FakeExchange(ex_id, fetch_delay), frozenset({"1h"}))
+            _async_fetch._async_exchanges[ex_id] = entry
+            return entry
+
+        patches = [
+            mock.patch.object(_async_fetch, "_create_exchange", fake_create),
+            mock.patch.dict(_async_fetch._async_exchanges, clear=True),
+            mock.patch.dict(_async_fetch._creating, clear=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self._cancel_creations)
+
+    @staticmethod
+    def _cancel_creations() -> None:
+        loop = _async_fetch._get_loop()
+        for fut in list(_async_fetch._creating.values()):
+            loop.call_soon_threadsafe(fut.cancel)
+
+    def test_cold_unreachable_primary_does_not_delay_fallbacks(self) -> None:
+        self.delays["slow"] = (5.0, 0.0)
+        start = time.monotonic()
+        ex_id, raw, _ = _async_fetch.race(
+            ["slow", "fast"], "X/Y", "1h", 3, hedge_delay=0.2
+        )
+        self.assertEqual(ex_id, "fast")
+        self.assertEqual(len(raw), 3)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_primary_head_start_counts_from_ready(self) -> None:
+        # Creation and fetch each fit in the head start, but not together.
+        self.delays["slow"] = (0.15, 0.15)
+        ex_id, _, _ = _async_fetch.race(
+            ["slow", "fast"], "X/Y", "1h", 3, hedge_delay=0.2
+        )
+        self.assertEqual(ex_id, "slow")
+
+    def test_warm_up_reports_failure(self) -> None:
+        self.delays["broken"] = None
+        failed = threading.Event()
+        seen = []
+
+        def on_error(ex_id, exc):
+            seen.append((ex_id, type(exc)))
+            failed.set()
+
+        _async_fetch.warm_up("broken", on_error=on_error)
+        self.assertTrue(failed.wait(2.0))
+        self.assertEqual(seen, [("broken", ccxt.RequestTimeout)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# tests/test_market_tools.py
+
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import ccxt
+import numpy as np
+
+from crypto_trading_agent import _ohlcv_cache, market_tools
+from crypto_trading_agent.simulation import GLOBAL_SIMULATOR
+
+
+def _fake_rows(limit: int, close: float) -> list:
+    """Raw CCXT-style OHLCV rows ending at the current minute."""
+    now_ms = int(time.time()) // 60 * 60_000
+    return [
+        [now_ms - 60_000 * (limit - 1 - i), close, close, close, close, 1.0]
+        for i in range(limit)
+    ]
+
+
+class OhlcvFetchTest(unittest.TestCase):
+    """Fetch paths with the exchange race stubbed out and a private cache."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.race_calls = []
+        self.close = 100.0
+
+        def fake_race(candidates, pair, timeframe, limit, hedge_delay=None):
+            self.race_calls.append((tuple(candidates), timeframe))
+            return candidates[0], _fake_rows(limit, self.close), {}
+
+        def fake_fetch_many(exchange_id, pair, timeframes, limit):
+            self.race_calls.append(((exchange_id,), tuple(timeframes)))
+            return [(tf, _fake_rows(limit, self.close)) for tf in timeframes]
+
+        patches = [
+            mock.patch.object(
+                market_tools,
+                "_OHLCV_CACHE",
+                _ohlcv_cache.FileCache(root=Path(tmp.name)),
+            ),
+            mock.patch.object(market_tools._async_fetch, "race", fake_race),
+            mock.patch.object(market_tools._async_fetch, "fetch_many", fake_fetch_many),
+            mock.patch.dict(market_tools._price_pushed_at, clear=True),
+            mock.patch.dict(market_tools._exchange_cooldown, clear=True),
+            mock.patch.dict(market_tools._exchange_failures, clear=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        GLOBAL_SIMULATOR.reset()
+        self.addCleanup(GLOBAL_SIMULATOR.reset)
+
+    def test_cached_fetch_after_reset_seeds_simulator_price(self) -> None:
+        self.assertEqual(market_tools.get_ohlcv("BTC/USDT", "1h")["status"], "success")
+        GLOBAL_SIMULATOR.reset()
+
+        result = market_tools.get_ohlcv("BTC/USDT", "1h")
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(len(self.race_calls), 1, "second fetch should hit the cache")
+        self.assertEqual(GLOBAL_SIMULATOR.last_prices.get("BTC/USDT"), 100.0)
+
+        pos = GLOBAL_SIMULATOR.place_order("BTC/USDT", "long", 100.0)
+        self.assertEqual(pos.entry_price, 100.0)
+
+    def test_open_candle_is_refetched_after_max_age(self) -> None:
+        market_tools.get_ohlcv("BTC/USDT", "1d")
+        market_tools.get_ohlcv("BTC/USDT", "1d")
+        self.assertEqual(len(self.race_calls), 1)
+
+        for entry in market_tools._OHLCV_CACHE._memory.values():
+            entry["fetched_at"] -= market_tools._OPEN_CANDLE_MAX_AGE + 1
+        self.close = 120.0
+        result = market_tools.get_ohlcv("BTC/USDT", "1d")
+        self.assertEqual(len(self.race_calls), 2)
+        self.assertEqual(result["candles"][-1]["close"], 120.0)
+        self.assertEqual(GLOBAL_SIMULATOR.last_prices["BTC/USDT"], 120.0)
+
+    def test_invalid_rsi_period_is_an_error_response(self) -> None:
+        candles = market_tools.get_ohlcv("BTC/USDT", "1h")["candles"]
+        for period in (0, -3):
+            result = market_tools.compute_basic_indicators(candles, rsi_period=period)
+            self.assertEqual(result["status"], "error", period)
+
+        multi = market_tools.get_ohlcv_multi("BTC/USDT", ["1h"], rsi_period=0)
+        self.assertEqual(multi["status"], "error")
+        self.assertEqual(multi["by_timeframe"]["1h"]["status"], "error")
+
+    def test_multi_success_resets_failure_count(self) -> None:
+        primary = market_tools._primary_exchange_id
+        market_tools._exchange_failures[primary] = 3
+        result = market_tools.get_ohlcv_multi("BTC/USDT", ["15m", "4h"])
+        self.assertEqual(result["status"], "success")
+        self.assertNotIn(primary, market_tools._exchange_failures)
+        self.assertNotIn(primary, market_tools._exchange_cooldown)
+
+    def test_multi_bad_symbol_is_not_an_exchange_failure(self) -> None:
+        def bad_symbol(exchange_id, pair, timeframes, limit):
+            return [(tf, ccxt.BadSymbol(f"{pair} not listed")) for tf in timeframes]
+
+        with mock.patch.object(market_tools._async_fetch, "fetch_many", bad_symbol):
+            market_tools.get_ohlcv_multi("NOPE/USDT", ["15m"])
+        primary = market_tools._primary_exchange_id
+        self.assertNotIn(primary, market_tools._exchange_cooldown)
+
+    def test_fallback_answer_is_served_from_cache(self) -> None:
+        primary = market_tools._primary_exchange_id
+
+        def fallback_wins(candidates, pair, timeframe, limit, hedge_delay=None):
+            self.race_calls.append((tuple(candidates), timeframe))
+            return candidates[1], _fake_rows(limit, self.close), {}
+
+        with mock.patch.object(market_tools._async_fetch, "race", fallback_wins):
+            first = market_tools.get_ohlcv("BTC/USDT", "1h")
+            second = market_tools.get_ohlcv("BTC/USDT", "1h")
+        self.assertEqual(market_tools._primary_exchange_id, primary)
+        self.assertEqual(len(self.race_calls), 1)
+        self.assertEqual(second["exchange"], first["exchange"])
+
+
+class RsiKernelTest(unittest.TestCase):
+    def test_rsi14_tail_matches_generic_kernel(self) -> None:
+        rng = np.random.default_rng(0)
+        series = [
+            100.0 + np.cumsum(rng.normal(size=300)),
+            np.full(50, 42.0),  # no losses: RSI pinned at 100
+            np.linspace(10.0, 1.0, 40),  # no gains
+        ]
+        for closes in series:
+            closes = np.ascontiguousarray(closes)
+            full = market_tools._rsi_wilder_loop(closes, 14)
+            for k in (1, 20, len(closes) - 14):
+                np.testing.assert_allclose(
+                    market_tools._rsi14_tail(closes, k),
+                    full[-k:],
+                    rtol=1e-12,
+                    atol=1e-12,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+# tests/test_simulation.py
+
+from __future__ import annotations
+
+import unittest
+
+from crypto_trading_agent.simulation import TradingSimulator
+
+
+class OpenPositionOrderTest(unittest.TestCase):
+    def test_open_positions_stay_in_open_order_after_a_close(self) -> None:
+        sim = TradingSimulator(initial_balance=10_000.0)
+        sim.update_price("BTC/USDT", 100.0)
+        ids = [sim.place_order("BTC/USDT", "long", 100.0).id for _ in range(4)]
+        sim.close_position(ids[0])
+
+        expected = ids[1:]
+        self.assertEqual(list(sim.positions), expected)
+        state = sim.portfolio_state()
+        self.assertEqual([p["id"] for p in state["open_positions"]], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()